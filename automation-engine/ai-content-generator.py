@@ -13,25 +13,192 @@ Child Welfare Priority: Kekoa's mental health protection and father-child reunif
 import os
 import json
 import logging
+import functools
+import hashlib
+import string
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from dataclasses import asdict, dataclass
 from pathlib import Path
 
-# Advanced AI and NLP libraries
-import openai
-from transformers import pipeline
-import spacy
-from legal_citation_parser import CitationParser
-from evidence_correlator import EvidenceAnalyzer
+# Heavy AI/NLP libraries and cross-platform connectors are imported lazily
+# inside the AIContentGenerator properties that use them.
 
-# Cross-platform integration imports
-from integrations.linear_connector import LinearSync
-from integrations.notion_sync import NotionKnowledgeBase
-from integrations.slack_notifications import SlackAlert
-from integrations.gmail_automation import GmailTracker
+OPTIMIZATION_API_MODEL = "gpt-4o"
 
-@dataclass
+# Static optimization instructions, sent first and byte-identical for every
+# section and motion. The API only caches prefixes of 1024+ tokens, so this
+# short block is not cached yet; the stable layout lets caching engage once
+# shared instructions grow past that size.
+REQUIREMENTS_PROMPT = """Optimize the following legal content for Hawaii Family Court submission.
+
+Requirements:
+- Maintain HFCR compliance
+- Professional legal tone
+- Persuasive and compelling presentation
+- Child welfare priority emphasis
+- Constitutional due process integration
+"""
+
+OPTIMIZATION_PROMPTS = {
+    "introduction": "Enhance for compelling opening with constitutional gravity",
+    "child_welfare": "Optimize for emotional impact while maintaining legal precision",
+    "legal_arguments": "Strengthen with authoritative citations and precedent",
+    "conclusion": "Maximize persuasive power for urgent judicial action"
+}
+
+OPTIMIZATION_CACHE_DIR = Path(".optimization-cache")
+OPTIMIZATION_CACHE_VERSION = 2
+GENERATED_MOTIONS_DIR = Path("generated-motions")
+
+class OptimizationCache:
+    """
+    🧩 Persistent cache of optimized legal content
+    
+    One file per backend model, entries keyed by an exact hash of the full
+    prompt, so edited facts or a different backend never reuse stale text
+    while identical sections are shared across motion types.
+    """
+    
+    def __init__(self, cache_dir: Path, model: str):
+        self.model = model
+        self.path = cache_dir / f"{model}.json"
+        self.entries: Dict[str, str] = {}
+        
+        if self.path.exists():
+            try:
+                data = json.loads(self.path.read_text())
+            except ValueError:
+                # A truncated or hand-edited file is treated as empty
+                data = {}
+            if data.get("version") == OPTIMIZATION_CACHE_VERSION and data.get("model") == model:
+                self.entries = data["entries"]
+    
+    @staticmethod
+    def key(prompt: str) -> str:
+        """Cache key for one section's full prompt"""
+        return hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+    
+    def get(self, key: str) -> Optional[str]:
+        return self.entries.get(key)
+    
+    def put(self, key: str, response: str):
+        self.entries[key] = response
+    
+    def save(self):
+        """Persist entries with their version and model tags, atomically"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        partial_path = self.path.with_suffix(".json.partial")
+        partial_path.write_text(json.dumps({
+            "version": OPTIMIZATION_CACHE_VERSION,
+            "model": self.model,
+            "entries": self.entries
+        }))
+        partial_path.replace(self.path)
+
+# Section templates, parsed once at import and filled from CaseContext fields
+_INTRODUCTION_TMPL = string.Template("""
+COMES NOW, Plaintiff ${plaintiff}, proceeding pro se, and respectfully 
+moves this Honorable Court pursuant to Hawaii Family Court Rules (HFCR) for 
+emergency relief to protect the welfare and mental health of the minor child, 
+${child_name}, who is currently experiencing documented psychological 
+distress under the existing custody arrangement.
+
+This motion is filed with the utmost urgency given:
+
+1. ${child_name}'s diagnosed clinical depression requiring immediate intervention;
+2. Documented patterns of neglect and inadequate care under current custody;
+3. The approaching November birthdays (${casey_birthday} and ${kekoa_birthday}) 
+   representing critical opportunities for family healing;
+4. The fundamental constitutional rights of both father and child to meaningful relationship.
+
+The evidence demonstrates that immediate judicial intervention is necessary to prevent 
+further psychological harm to ${child_name} and to restore the stability 
+and emotional support that only a loving father-child relationship can provide.
+""")
+
+_CHILD_WELFARE_TMPL = string.Template(r"""
+\section{CHILD WELFARE EMERGENCY - IMMEDIATE INTERVENTION REQUIRED}
+
+\subsection{Documented Mental Health Crisis}
+
+${child_name} has been diagnosed with clinical depression, representing 
+a mental health emergency that requires immediate parental intervention and support. 
+The current custody arrangement, which severely restricts meaningful father-child 
+contact, directly contributes to and exacerbates the child's psychological distress.
+
+\textbf{Clinical Evidence:}
+\begin{enumerate}
+\item Professional diagnosis of clinical depression;
+\item Progressive behavioral regression patterns;
+\item Academic and social performance deterioration;
+\item Withdrawal from previously enjoyed activities.
+\end{enumerate}
+
+\subsection{Pattern of Neglect Under Current Custody}
+
+The evidence reveals concerning patterns of inadequate care that directly impact 
+${child_name}'s physical and emotional wellbeing:
+
+\textbf{Physical Care Neglect:}
+\begin{itemize}
+\item Inconsistent bathing and hygiene maintenance;
+\item Inadequate supervision resulting in serious injury (broken arm);
+\item Age-inappropriate care standards and expectations.
+\end{itemize}
+
+\textbf{Emotional Neglect:}
+\begin{itemize}
+\item Substitution of electronic devices (iPad) for meaningful interaction;
+\item Lack of emotional support during mental health crisis;
+\item Dismissive attitude toward child's psychological needs.
+\end{itemize}
+
+\subsection{Father-Child Relationship as Mental Health Solution}
+
+The restoration of meaningful contact between ${plaintiff} and ${child_name} 
+represents the most effective intervention for addressing the child's mental health crisis:
+
+\begin{enumerate}
+\item \textbf{Historical Bond}: Strong pre-separation father-child relationship;
+\item \textbf{Emotional Support}: Paternal involvement as stabilizing influence;
+\item \textbf{Birthday Significance}: November celebrations as healing opportunities;
+\item \textbf{Mental Health Recovery}: Father's love and support as therapeutic intervention.
+\end{enumerate}
+""")
+
+# Motion document wrapper, matching templates/emergency-motions formatting
+MOTION_TITLES = {
+    "rule_60b_reconsideration": ("EMERGENCY MOTION FOR RELIEF FROM JUDGMENT",
+                                 "PURSUANT TO HFCR RULE 60(b)"),
+    "custody_modification": ("EMERGENCY MOTION FOR MODIFICATION OF CUSTODY",),
+    "emergency_hearing": ("MOTION FOR EMERGENCY HEARING",),
+    "child_protection": ("EMERGENCY MOTION FOR CHILD PROTECTION",)
+}
+
+# Preamble, caption and case box are shared with the emergency motion template
+MOTION_HEADER_TEMPLATE = (Path(__file__).resolve().parents[1] / "templates" /
+                          "emergency-motions" / "rule-60b-reconsideration.tex")
+MOTION_HEADER_END = "% End of shared motion header"
+
+_MOTION_TITLE_TMPL = string.Template(r"""\begin{center}
+${title}
+\end{center}
+
+\vspace{0.3in}
+
+""")
+
+_MOTION_CLOSING = "\\end{document}\n"
+
+@functools.lru_cache(maxsize=None)
+def _motion_header() -> str:
+    """LaTeX preamble, court caption and case box, read once from the template"""
+    template = MOTION_HEADER_TEMPLATE.read_text()
+    return template[:template.index(MOTION_HEADER_END)]
+
+@dataclass(frozen=True, slots=True)
 class CaseContext:
     """Comprehensive case context for AI content generation"""
     case_number: str = "1FDV-23-0001009"
@@ -48,17 +215,13 @@ class CaseContext:
     
     # Child welfare crisis indicators
     mental_health_status: str = "clinical depression diagnosed"
-    neglect_patterns: List[str] = None
+    neglect_patterns: Tuple[str, ...] = (
+        "inconsistent bathing and hygiene maintenance",
+        "broken arm incident with inadequate supervision",
+        "iPad substitution for meaningful parental interaction",
+        "age-inappropriate care patterns"
+    )
     father_child_separation_impact: str = "progressive psychological deterioration"
-    
-    def __post_init__(self):
-        if self.neglect_patterns is None:
-            self.neglect_patterns = [
-                "inconsistent bathing and hygiene maintenance",
-                "broken arm incident with inadequate supervision",
-                "iPad substitution for meaningful parental interaction",
-                "age-inappropriate care patterns"
-            ]
 
 class AIContentGenerator:
     """
@@ -76,33 +239,92 @@ class AIContentGenerator:
         self.case = case_context
         self.logger = self._setup_logging()
         
-        # Initialize AI models
-        self.legal_reasoner = pipeline("text-generation", 
-                                     model="microsoft/DialoGPT-medium")
-        self.citation_parser = CitationParser()
-        self.evidence_analyzer = EvidenceAnalyzer()
+        # CaseContext is frozen, so case-only sections are rendered once
+        case_fields = asdict(self.case)
+        self._frozen_sections: Dict[str, str] = {
+            'introduction': _INTRODUCTION_TMPL.substitute(case_fields),
+            'child_welfare': _CHILD_WELFARE_TMPL.substitute(case_fields)
+        }
+        
+        # Sections that depend only on motion_type, keyed by (generator, motion_type)
+        self._motion_section_cache: Dict[Tuple[str, str], str] = {}
         
-        # Cross-platform connectors
-        self.linear = LinearSync()
-        self.notion = NotionKnowledgeBase()
-        self.slack = SlackAlert()
-        self.gmail = GmailTracker()
+        # AI models and cross-platform connectors are created on first use
         
         self.logger.info("🧠 AI Content Generator initialized for case: %s", 
                         self.case.case_number)
     
+    # AI models (loaded on first access)
+    
+    @functools.cached_property
+    def openai_client(self):
+        """Hosted model client for legal language optimization"""
+        import openai
+        return openai.OpenAI()
+    
+    @functools.cached_property
+    def optimization_cache(self) -> OptimizationCache:
+        """Cache of hosted-model optimizations for this case"""
+        return OptimizationCache(OPTIMIZATION_CACHE_DIR / self.case.case_number,
+                                 OPTIMIZATION_API_MODEL)
+    
+    @functools.cached_property
+    def citation_parser(self):
+        """Legal citation parser"""
+        from legal_citation_parser import CitationParser
+        return CitationParser()
+    
+    @functools.cached_property
+    def evidence_analyzer(self):
+        """Evidence correlation and argument analysis engine"""
+        from evidence_correlator import EvidenceAnalyzer
+        return EvidenceAnalyzer()
+    
+    # Cross-platform connectors (connected on first access)
+    
+    @functools.cached_property
+    def linear(self):
+        from integrations.linear_connector import LinearSync
+        return LinearSync()
+    
+    @functools.cached_property
+    def notion(self):
+        from integrations.notion_sync import NotionKnowledgeBase
+        return NotionKnowledgeBase()
+    
+    @functools.cached_property
+    def slack(self):
+        from integrations.slack_notifications import SlackAlert
+        return SlackAlert()
+    
+    @functools.cached_property
+    def gmail(self):
+        from integrations.gmail_automation import GmailTracker
+        return GmailTracker()
+    
     def _setup_logging(self) -> logging.Logger:
         """Configure comprehensive logging for AI operations"""
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - 🤖 AI-GEN - %(message)s',
-            handlers=[
-                logging.FileHandler('ai_content_generation.log'),
-                logging.StreamHandler()
-            ]
-        )
+        # Only the first generator installs handlers; later instances reuse
+        # them instead of opening another log file handle
+        if not logging.getLogger().handlers:
+            logging.basicConfig(
+                level=logging.INFO,
+                format='%(asctime)s - %(levelname)s - 🤖 AI-GEN - %(message)s',
+                handlers=[
+                    logging.FileHandler('ai_content_generation.log'),
+                    logging.StreamHandler()
+                ]
+            )
         return logging.getLogger(__name__)
     
+    # Motion section -> optimization prompt focus
+    SECTION_OPTIMIZATION_TYPES = {
+        'introduction': 'introduction',
+        'child_welfare_analysis': 'child_welfare',
+        'legal_arguments': 'legal_arguments',
+        'conclusion': 'conclusion'
+    }
+    
     def generate_emergency_motion_content(self, 
                                         motion_type: str,
                                         evidence_database: Dict,
@@ -127,23 +349,38 @@ class AIContentGenerator:
             focus=strategic_priority
         )
         
-        # Generate core motion sections
-        content_sections = {
+        # Draft core motion sections
+        drafts = {
             'introduction': self._generate_introduction(motion_type, evidence_analysis),
-            'legal_standard': self._generate_legal_standard(motion_type),
+            'legal_standard': self._motion_section(self._generate_legal_standard, motion_type),
             'factual_background': self._generate_factual_background(evidence_analysis),
             'legal_arguments': self._generate_legal_arguments(motion_type, evidence_analysis),
             'child_welfare_analysis': self._generate_child_welfare_section(evidence_analysis),
             'constitutional_arguments': self._generate_constitutional_section(),
-            'conclusion': self._generate_conclusion(motion_type),
-            'prayer_for_relief': self._generate_prayer_for_relief(motion_type)
+            'conclusion': self._motion_section(self._generate_conclusion, motion_type),
+            'prayer_for_relief': self._motion_section(self._generate_prayer_for_relief, motion_type)
         }
         
+        # Optimize every section in one pass
+        optimized = self._optimize_sections([
+            (draft, self.SECTION_OPTIMIZATION_TYPES.get(section, section))
+            for section, draft in drafts.items()
+        ])
+        content_sections = dict(zip(drafts, optimized))
+        
         # Cross-platform synchronization
         self._sync_content_generation(motion_type, content_sections)
         
         return content_sections
     
+    def _motion_section(self, generator, motion_type: str) -> str:
+        """Generate a section that depends only on motion_type once per motion type"""
+        
+        key = (generator.__name__, motion_type)
+        if key not in self._motion_section_cache:
+            self._motion_section_cache[key] = generator(motion_type)
+        return self._motion_section_cache[key]
+    
     def _generate_introduction(self, motion_type: str, evidence_analysis: Dict) -> str:
         """
         🎯 Generate compelling introduction with child welfare focus
@@ -151,159 +388,198 @@ class AIContentGenerator:
         
         child_welfare_urgency = self._assess_urgency_level(evidence_analysis)
         
-        introduction_template = f"""
-COMES NOW, Plaintiff {self.case.plaintiff}, proceeding pro se, and respectfully 
-moves this Honorable Court pursuant to Hawaii Family Court Rules (HFCR) for 
-emergency relief to protect the welfare and mental health of the minor child, 
-{self.case.child_name}, who is currently experiencing documented psychological 
-distress under the existing custody arrangement.
-
-This motion is filed with the utmost urgency given:
-
-1. {self.case.child_name}'s diagnosed clinical depression requiring immediate intervention;
-2. Documented patterns of neglect and inadequate care under current custody;
-3. The approaching November birthdays ({self.case.casey_birthday} and {self.case.kekoa_birthday}) 
-   representing critical opportunities for family healing;
-4. The fundamental constitutional rights of both father and child to meaningful relationship.
-
-The evidence demonstrates that immediate judicial intervention is necessary to prevent 
-further psychological harm to {self.case.child_name} and to restore the stability 
-and emotional support that only a loving father-child relationship can provide.
-"""
-        
-        return self._optimize_legal_language(introduction_template, "introduction")
+        return self._frozen_sections['introduction']
     
     def _generate_child_welfare_section(self, evidence_analysis: Dict) -> str:
         """
         💙 Generate comprehensive child welfare protection arguments
         """
         
-        welfare_template = f"""
-\section{{CHILD WELFARE EMERGENCY - IMMEDIATE INTERVENTION REQUIRED}}
-
-\subsection{{Documented Mental Health Crisis}}
-
-{self.case.child_name} has been diagnosed with clinical depression, representing 
-a mental health emergency that requires immediate parental intervention and support. 
-The current custody arrangement, which severely restricts meaningful father-child 
-contact, directly contributes to and exacerbates the child's psychological distress.
-
-\textbf{{Clinical Evidence:}}
-\begin{{enumerate}}
-\item Professional diagnosis of clinical depression;
-\item Progressive behavioral regression patterns;
-\item Academic and social performance deterioration;
-\item Withdrawal from previously enjoyed activities.
-\end{{enumerate}}
-
-\subsection{{Pattern of Neglect Under Current Custody}}
-
-The evidence reveals concerning patterns of inadequate care that directly impact 
-{self.case.child_name}'s physical and emotional wellbeing:
-
-\textbf{{Physical Care Neglect:}}
-\begin{{itemize}}
-\item Inconsistent bathing and hygiene maintenance;
-\item Inadequate supervision resulting in serious injury (broken arm);
-\item Age-inappropriate care standards and expectations.
-\end{{itemize}}
-
-\textbf{{Emotional Neglect:}}
-\begin{{itemize}}
-\item Substitution of electronic devices (iPad) for meaningful interaction;
-\item Lack of emotional support during mental health crisis;
-\item Dismissive attitude toward child's psychological needs.
-\end{{itemize}}
-
-\subsection{{Father-Child Relationship as Mental Health Solution}}
-
-The restoration of meaningful contact between {self.case.plaintiff} and {self.case.child_name} 
-represents the most effective intervention for addressing the child's mental health crisis:
-
-\begin{{enumerate}}
-\item \textbf{{Historical Bond}}: Strong pre-separation father-child relationship;
-\item \textbf{{Emotional Support}}: Paternal involvement as stabilizing influence;
-\item \textbf{{Birthday Significance}}: November celebrations as healing opportunities;
-\item \textbf{{Mental Health Recovery}}: Father's love and support as therapeutic intervention.
-\end{{enumerate}}
-"""
-        
-        return self._optimize_legal_language(welfare_template, "child_welfare")
+        return self._frozen_sections['child_welfare']
+    
+    def _optimization_focus(self, section_type: str) -> str:
+        """Section-specific optimization instruction"""
+        return "Focus: " + OPTIMIZATION_PROMPTS.get(section_type, "professional enhancement")
     
-    def _optimize_legal_language(self, content: str, section_type: str) -> str:
+    def _optimize_sections(self, items: List[Tuple[str, str]]) -> List[str]:
         """
-        ✨ AI-powered legal language optimization and professional enhancement
+        ✨ Optimize several sections in one pass
+        
+        Sections optimized before with an identical prompt are served from
+        the optimization cache and the rest go to the hosted API. Without
+        OPENAI_API_KEY the drafts are returned unchanged.
+        
+        Args:
+            items: (content, section_type) pairs
+            
+        Returns:
+            Optimized content in the same order as items
         """
         
-        optimization_prompts = {
-            "introduction": "Enhance for compelling opening with constitutional gravity",
-            "child_welfare": "Optimize for emotional impact while maintaining legal precision",
-            "legal_arguments": "Strengthen with authoritative citations and precedent",
-            "conclusion": "Maximize persuasive power for urgent judicial action"
-        }
+        if not os.environ.get("OPENAI_API_KEY"):
+            # No local model is an instruction-following legal rewriter, so
+            # drafts are only replaced by hosted-model output
+            self.logger.info("ℹ️ OPENAI_API_KEY not set, keeping %d drafted sections unchanged",
+                             len(items))
+            return [content for content, _ in items]
         
-        # AI-powered language optimization
-        prompt = f"""Optimize the following legal content for Hawaii Family Court 
-submission with focus on {optimization_prompts.get(section_type, 'professional enhancement')}:
-
-{content}
-
-Requirements:
-- Maintain HFCR compliance
-- Professional legal tone
-- Persuasive and compelling presentation
-- Child welfare priority emphasis
-- Constitutional due process integration
-"""
+        keys = [
+            OptimizationCache.key(
+                f"{REQUIREMENTS_PROMPT}\n{self._optimization_focus(section_type)}\n\n{content}"
+            )
+            for content, section_type in items
+        ]
+        
+        optimized: List[Optional[str]] = [None] * len(items)
+        cache = None
+        try:
+            cache = self.optimization_cache
+            optimized = [cache.get(key) for key in keys]
+        except Exception as e:
+            self.logger.warning("⚠️ Optimization cache unavailable: %s", e)
+        
+        misses = [i for i, text in enumerate(optimized) if text is None]
         
         try:
-            # Note: In production, this would use actual AI API
-            optimized_content = content  # Placeholder for AI optimization
+            if misses:
+                results = self._optimize_with_api([items[i] for i in misses])
+                
+                # Failed sections stay None here and fall back to their drafts below
+                for i, text in zip(misses, results):
+                    optimized[i] = text
+                
+                succeeded = [i for i, text in zip(misses, results) if text is not None]
+                if cache is not None and succeeded:
+                    self._store_in_optimization_cache(
+                        cache, [(keys[i], optimized[i]) for i in succeeded]
+                    )
             
-            self.logger.info("✨ Content optimized for section: %s", section_type)
-            return optimized_content
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info("✨ Content optimized for sections: %s (%d from cache)",
+                                 ", ".join(section_type for _, section_type in items),
+                                 len(items) - len(misses))
+            return [content if text is None else text
+                    for (content, _), text in zip(items, optimized)]
             
         except Exception as e:
-            self.logger.error("❌ Optimization failed for %s: %s", section_type, str(e))
-            return content
+            self.logger.error("❌ Optimization failed for %d sections: %s", len(misses), e)
+            return [content if text is None else text
+                    for (content, _), text in zip(items, optimized)]
+    
+    def _store_in_optimization_cache(self, cache: OptimizationCache,
+                                     entries: List[Tuple[str, str]]):
+        """Add freshly optimized sections to the cache and persist it"""
+        
+        try:
+            for key, response in entries:
+                cache.put(key, response)
+            cache.save()
+        except Exception as e:
+            self.logger.warning("⚠️ Optimization cache update failed: %s", e)
+    
+    def _optimize_with_api(self, items: List[Tuple[str, str]]) -> List[Optional[str]]:
+        """
+        Optimize sections concurrently via the hosted API
+        
+        Returns:
+            Optimized content per item, or None where that section's call failed
+        """
+        
+        labels = [f"section {i} ({section_type})" for i, (_, section_type) in enumerate(items)]
+        results = self._run_concurrently("Optimization", {
+            label: functools.partial(self._optimize_section_with_api, content, section_type)
+            for label, (content, section_type) in zip(labels, items)
+        })
+        
+        return [results.get(label) for label in labels]
+    
+    def _optimize_section_with_api(self, content: str, section_type: str) -> str:
+        """Optimize one section, sending the shared requirements prefix first"""
+        
+        response = self.openai_client.chat.completions.create(
+            model=OPTIMIZATION_API_MODEL,
+            messages=[
+                {"role": "system", "content": REQUIREMENTS_PROMPT},
+                {"role": "system", "content": self._optimization_focus(section_type)},
+                {"role": "user", "content": content}
+            ],
+            prompt_cache_key="hfcr-legal-optimization"
+        )
+        return response.choices[0].message.content or content
     
     def _sync_content_generation(self, motion_type: str, content_sections: Dict[str, str]):
         """
         🔗 Synchronize generated content across all platforms
         """
         
-        try:
+        synced = self._run_platform_calls("Sync", {
             # Update Linear with generation progress
-            self.linear.update_issue_progress(
+            'Linear': lambda: self.linear.update_issue_progress(
                 issue_title=f"Emergency Motion Generation: {motion_type}",
                 status="content_generated",
                 details=f"Generated {len(content_sections)} sections"
-            )
+            ),
             
             # Store in Notion knowledge base
-            self.notion.save_generated_content(
+            'Notion': lambda: self.notion.save_generated_content(
                 case_number=self.case.case_number,
                 motion_type=motion_type,
                 content=content_sections
-            )
+            ),
             
             # Notify team via Slack
-            self.slack.send_generation_complete_alert(
+            'Slack': lambda: self.slack.send_generation_complete_alert(
                 motion_type=motion_type,
                 case=self.case.case_number,
                 sections_count=len(content_sections)
-            )
+            ),
             
             # Track in Gmail for service coordination
-            self.gmail.create_filing_preparation_thread(
+            'Gmail': lambda: self.gmail.create_filing_preparation_thread(
                 motion_type=motion_type,
                 deadline=self.case.filing_deadline
             )
-            
+        })
+        
+        if synced:
             self.logger.info("🔄 Cross-platform synchronization complete")
-            
-        except Exception as e:
-            self.logger.error("❌ Sync failed: %s", str(e))
+    
+    def _run_platform_calls(self, action: str, calls: Dict[str, Callable[[], object]]) -> bool:
+        """
+        🌐 Run independent platform calls concurrently
+        
+        Each failure is logged on its own and does not stop the other platforms.
+        
+        Returns:
+            True if every call succeeded
+        """
+        
+        return len(self._run_concurrently(action, calls)) == len(calls)
+    
+    def _run_concurrently(self, action: str,
+                          calls: Dict[str, Callable[[], object]]) -> Dict[str, object]:
+        """
+        Run independent calls on a thread pool, logging each failure on its own
+        
+        Returns:
+            Results of the calls that succeeded, keyed like calls
+        """
+        
+        if not calls:
+            return {}
+        
+        with ThreadPoolExecutor(max_workers=len(calls)) as executor:
+            futures = {name: executor.submit(call) for name, call in calls.items()}
+        
+        results = {}
+        for name, future in futures.items():
+            error = future.exception()
+            if error is not None:
+                self.logger.error("❌ %s failed on %s: %s", action, name, error)
+            else:
+                results[name] = future.result()
+        
+        return results
     
     def generate_case_specific_content(self) -> Dict[str, str]:
         """
@@ -395,9 +671,12 @@ mental health recovery and emotional development.
         
         return mental_health_evidence
     
-    def create_comprehensive_motion(self, motion_type: str) -> str:
+    def create_comprehensive_motion(self, motion_type: str) -> Path:
         """
         🎯 Create complete motion with AI optimization and cross-platform integration
+        
+        Returns:
+            Path of the motion written under generated-motions/
         """
         
         self.logger.info("🚀 Creating comprehensive %s motion", motion_type)
@@ -413,46 +692,87 @@ mental health recovery and emotional development.
         # Add case-specific optimization
         case_specific = self.generate_case_specific_content()
         
-        # Combine all sections into comprehensive motion
-        complete_motion = self._assemble_complete_motion(
-            content_sections, 
-            case_specific
+        # Stream sections through the final pass to a temp file, then move it
+        # into place so a failure never leaves a truncated motion for CI
+        motion_path = GENERATED_MOTIONS_DIR / f"{motion_type}.tex"
+        motion_path.parent.mkdir(parents=True, exist_ok=True)
+        partial_path = motion_path.with_name(motion_path.name + ".partial")
+        try:
+            with partial_path.open('w', encoding='utf-8') as motion_file:
+                motion_file.write(self._motion_preamble(motion_type))
+                motion_file.writelines(self._final_optimization_pass(
+                    self._assemble_complete_motion(content_sections, case_specific)
+                ))
+                motion_file.write(_MOTION_CLOSING)
+            partial_path.replace(motion_path)
+        except BaseException:
+            partial_path.unlink(missing_ok=True)
+            raise
+        
+        # Cross-platform notification of completion
+        self._notify_motion_completion(motion_type, motion_path)
+        
+        return motion_path
+    
+    def _motion_preamble(self, motion_type: str) -> str:
+        """
+        📜 LaTeX preamble, court caption and title for a motion
+        """
+        
+        title_lines = MOTION_TITLES.get(motion_type, (motion_type.replace("_", " ").upper(),))
+        return _motion_header() + _MOTION_TITLE_TMPL.substitute(
+            title="\\\\\n".join(
+                r"{\fontsize{14}{17}\selectfont\textbf{" + line + "}}" for line in title_lines
+            )
         )
+    
+    def _assemble_complete_motion(self, 
+                                  content_sections: Dict[str, str],
+                                  case_specific: Dict[str, str]) -> Iterator[str]:
+        """
+        📑 Yield motion sections in filing order, one at a time
         
-        # Final AI optimization pass
-        optimized_motion = self._final_optimization_pass(complete_motion)
+        Case-specific content is placed ahead of the conclusion.
+        """
         
-        # Cross-platform notification of completion
-        self._notify_motion_completion(motion_type, optimized_motion)
+        for section, content in content_sections.items():
+            if section == 'conclusion':
+                yield from case_specific.values()
+            yield content
+    
+    def _final_optimization_pass(self, sections: Iterable[str]) -> Iterator[str]:
+        """
+        ✨ Final per-section cleanup, streamed so the full motion is never held in memory
+        """
         
-        return optimized_motion
+        for section in sections:
+            yield section.strip() + "\n\n"
     
-    def _notify_motion_completion(self, motion_type: str, motion_content: str):
+    def _notify_motion_completion(self, motion_type: str, motion_path: Path):
         """
         📢 Notify all platforms of motion completion
         """
         
-        try:
+        notified = self._run_platform_calls("Notification", {
             # Update Linear with completion status
-            self.linear.complete_motion_task(motion_type)
+            'Linear': lambda: self.linear.complete_motion_task(motion_type),
             
             # Save to Notion for future reference
-            self.notion.archive_completed_motion(motion_type, motion_content)
+            'Notion': lambda: self.notion.archive_completed_motion(motion_type, motion_path),
             
             # Alert team via Slack
-            self.slack.send_motion_ready_alert(
+            'Slack': lambda: self.slack.send_motion_ready_alert(
                 motion_type=motion_type,
                 case=self.case.case_number,
                 deadline=self.case.filing_deadline
-            )
+            ),
             
             # Prepare Gmail for service coordination
-            self.gmail.prepare_service_tracking(motion_type)
-            
+            'Gmail': lambda: self.gmail.prepare_service_tracking(motion_type)
+        })
+        
+        if notified:
             self.logger.info("✅ All platforms notified of motion completion")
-            
-        except Exception as e:
-            self.logger.error("❌ Notification error: %s", str(e))
 
 # 🚀 MAIN EXECUTION ENGINE
 if __name__ == "__main__":
@@ -0,0 +1,238 @@
+"""
+🧪 Behaviour tests for the AI content generator
+
+AI models and cross-platform connectors are stubbed, so these run without
+network access or model downloads.
+"""
+
+import importlib.util
+import sys
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+MODULE_PATH = Path(__file__).resolve().parents[1] / "automation-engine" / "ai-content-generator.py"
+
+spec = importlib.util.spec_from_file_location("ai_content_generator", MODULE_PATH)
+ai_content_generator = importlib.util.module_from_spec(spec)
+sys.modules[spec.name] = ai_content_generator
+spec.loader.exec_module(ai_content_generator)
+
+
+@pytest.fixture
+def generator(tmp_path, monkeypatch):
+    """Generator working in a temp directory with all platform connectors stubbed"""
+    monkeypatch.chdir(tmp_path)
+    generator = ai_content_generator.AIContentGenerator(ai_content_generator.CaseContext())
+    for platform in ("linear", "notion", "slack", "gmail"):
+        setattr(generator, platform, Mock())
+    return generator
+
+
+def test_construction_does_not_import_heavy_libraries(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    for module in ("transformers", "openai"):
+        monkeypatch.delitem(sys.modules, module, raising=False)
+
+    ai_content_generator.AIContentGenerator(ai_content_generator.CaseContext())
+
+    assert "transformers" not in sys.modules
+    assert "openai" not in sys.modules
+
+
+# 🔗 Cross-platform synchronization
+
+def test_sync_calls_every_platform(generator):
+    generator._sync_content_generation("custody_modification", {"introduction": "text"})
+
+    generator.linear.update_issue_progress.assert_called_once()
+    generator.notion.save_generated_content.assert_called_once()
+    generator.slack.send_generation_complete_alert.assert_called_once()
+    generator.gmail.create_filing_preparation_thread.assert_called_once()
+
+
+def test_platform_failure_does_not_block_other_platforms(generator, caplog):
+    generator.linear.complete_motion_task.side_effect = RuntimeError("Linear down")
+
+    generator._notify_motion_completion("custody_modification", Path("motion.tex"))
+
+    generator.notion.archive_completed_motion.assert_called_once_with(
+        "custody_modification", Path("motion.tex"))
+    generator.slack.send_motion_ready_alert.assert_called_once()
+    generator.gmail.prepare_service_tracking.assert_called_once_with("custody_modification")
+    assert "Notification failed on Linear: Linear down" in caplog.text
+    assert "All platforms notified" not in caplog.text
+
+
+def test_run_concurrently_returns_only_successful_results(generator):
+    def fail():
+        raise ValueError("boom")
+
+    results = generator._run_concurrently("Test", {"ok": lambda: 1, "bad": fail})
+
+    assert results == {"ok": 1}
+
+
+# 📑 Motion assembly and output
+
+def test_case_specific_content_precedes_conclusion(generator):
+    sections = {"introduction": "INTRO", "conclusion": "CONCLUSION", "prayer_for_relief": "PRAYER"}
+
+    assembled = list(generator._assemble_complete_motion(sections, {"crisis": "CRISIS"}))
+
+    assert assembled == ["INTRO", "CRISIS", "CONCLUSION", "PRAYER"]
+
+
+@pytest.fixture
+def motion_generator(generator):
+    """Generator whose evidence and section generation are stubbed"""
+    generator.integrate_evidence_database = Mock(return_value={})
+    generator.generate_emergency_motion_content = Mock(
+        return_value={"introduction": "INTRO", "conclusion": "CONCLUSION"})
+    return generator
+
+
+def test_motion_is_written_as_complete_latex_document(motion_generator):
+    motion_path = motion_generator.create_comprehensive_motion("rule_60b_reconsideration")
+
+    motion = motion_path.read_text()
+    assert motion_path == Path("generated-motions/rule_60b_reconsideration.tex")
+    assert motion.startswith("\\documentclass")
+    assert motion.startswith(ai_content_generator._motion_header())
+    assert "\\textbf{CASE NO.} & \\textbf{1FDV-23-0001009}" in motion
+    assert "PURSUANT TO HFCR RULE 60(b)" in motion
+    assert motion.index("\\begin{document}") < motion.index("INTRO") < motion.index("CONCLUSION")
+    assert motion.rstrip().endswith("\\end{document}")
+    motion_generator.notion.archive_completed_motion.assert_called_once_with(
+        "rule_60b_reconsideration", motion_path)
+
+
+def test_failed_generation_leaves_no_motion_file(motion_generator):
+    def failing_pass(sections):
+        yield next(iter(sections))
+        raise RuntimeError("generation failed")
+
+    motion_generator._final_optimization_pass = failing_pass
+
+    with pytest.raises(RuntimeError):
+        motion_generator.create_comprehensive_motion("custody_modification")
+
+    assert list(Path("generated-motions").iterdir()) == []
+
+
+# ✨ Language optimization and caching
+
+@pytest.fixture
+def api_generator(generator, monkeypatch):
+    """Generator with a stubbed hosted API that fails on drafts reading 'FAIL'"""
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+
+    def create(model, messages, **kwargs):
+        draft = messages[-1]["content"]
+        if draft == "FAIL":
+            raise RuntimeError("API error")
+        return Mock(choices=[Mock(message=Mock(content="OPTIMIZED " + draft))])
+
+    generator.openai_client = Mock()
+    generator.openai_client.chat.completions.create.side_effect = create
+    return generator
+
+
+def sent_drafts(generator):
+    return [call.kwargs["messages"][-1]["content"]
+            for call in generator.openai_client.chat.completions.create.call_args_list]
+
+
+def test_drafts_unchanged_without_api_key(generator, monkeypatch):
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    generator.openai_client = Mock()
+
+    optimized = generator._optimize_sections([("draft", "introduction")])
+
+    assert optimized == ["draft"]
+    generator.openai_client.chat.completions.create.assert_not_called()
+
+
+def test_failed_section_keeps_draft_and_is_retried(api_generator):
+    items = [("A", "introduction"), ("FAIL", "legal_standard"), ("C", "conclusion")]
+
+    first = api_generator._optimize_sections(items)
+    api_generator.openai_client.chat.completions.create.reset_mock()
+    second = api_generator._optimize_sections(items)
+
+    assert first == second == ["OPTIMIZED A", "FAIL", "OPTIMIZED C"]
+    assert sent_drafts(api_generator) == ["FAIL"]
+
+
+def test_identical_section_is_shared_across_motion_types(api_generator):
+    api_generator._optimize_sections([("A", "introduction")])
+    api_generator._optimize_sections([("A", "introduction")])
+    api_generator._optimize_sections([("A", "conclusion")])
+
+    assert sent_drafts(api_generator) == ["A", "A"]
+
+
+def test_persisted_cache_requires_matching_version(api_generator, monkeypatch):
+    api_generator._optimize_sections([("A", "introduction")])
+
+    cache_dir = ai_content_generator.OPTIMIZATION_CACHE_DIR / api_generator.case.case_number
+    model = ai_content_generator.OPTIMIZATION_API_MODEL
+    assert list(ai_content_generator.OptimizationCache(cache_dir, model).entries.values()) == [
+        "OPTIMIZED A"]
+
+    monkeypatch.setattr(ai_content_generator, "OPTIMIZATION_CACHE_VERSION",
+                        ai_content_generator.OPTIMIZATION_CACHE_VERSION + 1)
+    assert ai_content_generator.OptimizationCache(cache_dir, model).entries == {}
+
+
+def test_unparsable_cache_file_is_treated_as_empty(tmp_path):
+    model = ai_content_generator.OPTIMIZATION_API_MODEL
+    (tmp_path / f"{model}.json").write_text('{"version": 2, "entr')
+
+    cache = ai_content_generator.OptimizationCache(tmp_path, model)
+    assert cache.entries == {}
+
+    cache.put("key", "text")
+    cache.save()
+    assert ai_content_generator.OptimizationCache(tmp_path, model).entries == {"key": "text"}
+    assert [path.name for path in tmp_path.iterdir()] == [f"{model}.json"]
+
+
+# 🎯 Motion-type section memoization
+
+def test_motion_section_generated_once_per_motion_type(generator):
+    def _generate_conclusion(motion_type):
+        return f"Conclusion for {motion_type}"
+
+    section_generator = Mock(side_effect=_generate_conclusion)
+    section_generator.__name__ = "_generate_conclusion"
+
+    first = generator._motion_section(section_generator, "custody_modification")
+    repeat = generator._motion_section(section_generator, "custody_modification")
+    other = generator._motion_section(section_generator, "rule_60b_reconsideration")
+
+    assert first == repeat == "Conclusion for custody_modification"
+    assert other == "Conclusion for rule_60b_reconsideration"
+    assert section_generator.call_count == 2
+
+
+# 🧩 Section templates
+
+def test_child_welfare_section_is_rendered_from_template(generator):
+    section = generator._generate_child_welfare_section({})
+
+    assert "\\textbf{Clinical Evidence:}" in section
+    assert "\\begin{enumerate}" in section
+    assert generator.case.child_name in section
+    assert "${" not in section
+
+
+def test_sections_are_rendered_once_from_case_context(generator):
+    introduction = generator._frozen_sections["introduction"]
+
+    assert generator.case.plaintiff in introduction
+    assert generator.case.casey_birthday in introduction
+    assert generator.case.kekoa_birthday in introduction
+    assert generator._generate_child_welfare_section({}) is generator._frozen_sections[
+        "child_welfare"]